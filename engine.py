@@ -29,6 +29,9 @@ from sgtk import TankError
 
 LOG_CHANNEL = "sgtk.tk-flame"
 
+# Characters backburner does not accept in a job name
+BACKBURNER_JOB_NAME_INVALID_CHARS_RE = re.compile(r"[^0-9a-zA-Z_\-,\. %]+")
+
 
 class FlameEngine(sgtk.platform.Engine):
     """
@@ -1449,7 +1452,7 @@ class FlameEngine(sgtk.platform.Engine):
 
         # remove any non-trivial characters
         #
-        return re.sub(r"[^0-9a-zA-Z_\-,\. %]+", "_", sanitized_job_name)
+        return BACKBURNER_JOB_NAME_INVALID_CHARS_RE.sub("_", sanitized_job_name)
 
 
     def create_local_backburner_job(self, job_name, description, dependencies,
@@ -15,6 +15,16 @@ import sgtk
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
+# Flame encodes file sequences as file.[first-last].ext
+_FRAME_RANGE_RE = re.compile(r"(\[(\d+)-(\d+)\])\.")
+
+_ITEM_FILTERS = ("flame.video", "flame.movie", "flame.openClip", "flame.batchOpenClip")
+
+_VER_DEPARTMENT_VALUE = "Flame"
+
+# Every item presented to accept() is accepted, the publisher only reads it.
+_ACCEPT_RESULT = {"accepted": True}
+
 
 class CreateVersionPlugin(HookBaseClass):
     """
@@ -28,20 +38,21 @@ class CreateVersionPlugin(HookBaseClass):
         self.engine = self.publisher.engine
         self.sg = self.engine.shotgun
 
-    @property
-    def icon(self):
-        """
-        Path to an png icon on disk
-        """
-
         # look for icon one level up from this hook's folder in "icons" folder
-        return os.path.join(
+        self._icon_path = os.path.join(
             self.disk_location,
             os.pardir,
             "icons",
             "publish.png"
         )
 
+    @property
+    def icon(self):
+        """
+        Path to an png icon on disk
+        """
+        return self._icon_path
+
     @property
     def name(self):
         """
@@ -87,7 +98,7 @@ class CreateVersionPlugin(HookBaseClass):
         accept() method. Strings can contain glob patters such as *, for example
         ["maya.*", "file.maya"]
         """
-        return ["flame.video", "flame.movie", "flame.openClip", "flame.batchOpenClip"]
+        return _ITEM_FILTERS
 
     def accept(self, settings, item):
         """
@@ -115,7 +126,7 @@ class CreateVersionPlugin(HookBaseClass):
         :returns: dictionary with boolean keys accepted, required and enabled
         """
 
-        return {"accepted": True}
+        return _ACCEPT_RESULT
 
     def validate(self, settings, item):
         """
@@ -142,44 +153,54 @@ class CreateVersionPlugin(HookBaseClass):
             instances.
         :param item: Item to process
         """
-        path = item.properties.get("path", None)
+        context = item.context
+        properties = item.properties
 
-        # Build the Version metadata dictionary
-        ver_data = dict(
-            project=item.context.project,
-            code=item.name,
-            description=item.description,
-            entity=item.context.entity,
-            sg_task=item.context.task,
-            sg_path_to_frames=path
-        )
-
-        ver_data["sg_department"] = "Flame"
+        path = properties.get("path", None)
 
-        asset_info = item.properties.get("assetInfo", {})
+        # Build the Version metadata dictionary
+        ver_data = {
+            "project": context.project,
+            "code": item.name,
+            "description": item.description,
+            "entity": context.entity,
+            "sg_task": context.task,
+            "sg_path_to_frames": path,
+            "sg_department": _VER_DEPARTMENT_VALUE
+        }
+
+        asset_info = properties.get("assetInfo", {})
 
         frame_rate = asset_info.get("fps")
         if frame_rate:
             ver_data["sg_uploaded_movie_frame_rate"] = float(frame_rate)
 
         aspect_ratio = asset_info.get("aspectRatio")
-        if asset_info:
-            ver_data["sg_frames_aspect_ratio"] = float(aspect_ratio)
-            ver_data["sg_movie_aspect_ratio"] = float(aspect_ratio)
+        if aspect_ratio is not None:
+            aspect_ratio = float(aspect_ratio)
+            ver_data["sg_frames_aspect_ratio"] = aspect_ratio
+            ver_data["sg_movie_aspect_ratio"] = aspect_ratio
 
         # For file sequences, we want the path as provided by flame.
         # The property 'path' will be encoded the shotgun way file.%d.ext
         # while 'file_path' will be encoded the flame way file.[##-##].ext.
-        file_path = item.properties.get("file_path", path)
+        file_path = properties.get("file_path", path)
 
-        re_match = re.search(r"(\[[0-9]+-[0-9]+\])\.", file_path)
+        # Only file sequences hold a frame range, skip the regex otherwise
+        re_match = None
+        if "[" in file_path:
+            re_match = _FRAME_RANGE_RE.search(file_path)
         if re_match:
-            ver_data["frame_range"] = re_match.group(1)[1:-1]
+            ver_data["frame_range"] = "%s-%s" % (re_match.group(2), re_match.group(3))
 
-        if "sourceIn" in asset_info and "sourceOut" in asset_info:
-            ver_data["sg_first_frame"] = asset_info["sourceIn"]
-            ver_data["sg_last_frame"] = asset_info["sourceOut"] - 1
-            ver_data["frame_count"] = int(ver_data["sg_last_frame"]) - int(ver_data["sg_first_frame"]) + 1
+        source_in = asset_info.get("sourceIn")
+        source_out = asset_info.get("sourceOut")
+        if source_in is not None and source_out is not None:
+            # sourceOut is exclusive
+            last_frame = source_out - 1
+            ver_data["sg_first_frame"] = source_in
+            ver_data["sg_last_frame"] = last_frame
+            ver_data["frame_count"] = int(last_frame) - int(source_in) + 1
 
         # Create the Version
         version = self.sg.create("Version", ver_data)
@@ -187,7 +208,7 @@ class CreateVersionPlugin(HookBaseClass):
         # Keep the version reference for the other plugins
         item.properties["Version"] = version
 
-        dependencies = item.properties.get("backgroundJobId")
+        dependencies = properties.get("backgroundJobId")
 
         # Create the Movie preview in background
         # (Thumbnail will be generated server-side from movie)
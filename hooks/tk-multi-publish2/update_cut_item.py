@@ -27,20 +27,21 @@ class UpdateCutPlugin(HookBaseClass):
         self.engine = self.publisher.engine
         self.sg = self.engine.shotgun
 
-    @property
-    def icon(self):
-        """
-        Path to an png icon on disk
-        """
-
         # look for icon one level up from this hook's folder in "icons" folder
-        return os.path.join(
+        self._icon_path = os.path.join(
             self.disk_location,
             os.pardir,
             "icons",
             "publish.png"
         )
 
+    @property
+    def icon(self):
+        """
+        Path to an png icon on disk
+        """
+        return self._icon_path
+
     @property
     def name(self):
         """
@@ -128,27 +128,30 @@ class ThumbnailGeneratorFlame(ThumbnailGenerator):
         :return: Backburner job ID created.
         """
         job_context = "Upload Shotgun Thumbnail"
+        display_name = thumbnail_job["display_name"]
+        path = thumbnail_job["path"]
+
         job_name = self.engine.sanitize_backburner_job_name(
-            job_name=thumbnail_job.get("display_name"),
+            job_name=display_name,
             job_suffix=" - %s" % job_context
         )
         job_description = "%s for %s\nTemporary file %s" % (
             job_context,
-            thumbnail_job.get("display_name"),
-            thumbnail_job.get("path")
+            display_name,
+            path
         )
         return self.engine.create_local_backburner_job(
             job_name=job_name,
             description=job_description,
-            dependencies=thumbnail_job.get("dependencies"),
+            dependencies=thumbnail_job["dependencies"],
             instance="backburner_hooks",
             method_name="upload_to_shotgun",
             args={
-                "targets": thumbnail_job.get("target_entities"),
-                "path": thumbnail_job.get("path"),
+                "targets": thumbnail_job["target_entities"],
+                "path": path,
                 "field_name": "thumb_image",
-                "display_name": thumbnail_job.get("display_name"),
-                "files_to_delete": thumbnail_job.get("files_to_delete")
+                "display_name": display_name,
+                "files_to_delete": thumbnail_job["files_to_delete"]
             }
         )
 
@@ -166,27 +169,30 @@ class ThumbnailGeneratorFlame(ThumbnailGenerator):
             field_name = "sg_uploaded_movie"
 
         job_context = "Upload Shotgun Preview"
+        display_name = preview_job["display_name"]
+        path = preview_job["path"]
+
         job_name = self.engine.sanitize_backburner_job_name(
-            job_name=preview_job.get("display_name"),
+            job_name=display_name,
             job_suffix=" - %s" % job_context
         )
         job_description = "%s for %s\nTemporary file %s" % (
             job_context,
-            preview_job.get("display_name"),
-            preview_job.get("path")
+            display_name,
+            path
         )
         return self.engine.create_local_backburner_job(
             job_name=job_name,
             description=job_description,
-            dependencies=preview_job.get("dependencies"),
+            dependencies=preview_job["dependencies"],
             instance="backburner_hooks",
             method_name="upload_to_shotgun",
             args={
-                "targets": preview_job.get("target_entities"),
-                "path": preview_job.get("path"),
+                "targets": preview_job["target_entities"],
+                "path": path,
                 "field_name": field_name,
-                "display_name": preview_job.get("display_name"),
-                "files_to_delete": preview_job.get("files_to_delete")
+                "display_name": display_name,
+                "files_to_delete": preview_job["files_to_delete"]
             }
         )
 
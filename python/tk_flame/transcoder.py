@@ -108,7 +108,7 @@ class Transcoder(object):
         clip.name = os.path.splitext(os.path.basename(path))[0]
         return path
 
-    def _create_open_clip_file(self, src_path, asset_info):
+    def _create_open_clip_file(self, src_path, src_extension, asset_info):
         """
         Create an Open Clip file that points to the exported asset that can
         be used to import the clip before it is actually finished exporting.
@@ -117,6 +117,7 @@ class Transcoder(object):
         job before the first one complete.
 
         :param src_path: Path to the media for which transcoding need to be done.
+        :param src_extension: Lower case extension of src_path.
         :param asset_info: Dictionary of attribute passed by Flame's python
             hooks collected either thru an export (sg_export_hooks.py) or a
             batch render (sg_batch_hooks.py).
@@ -167,11 +168,10 @@ class Transcoder(object):
 
         metadata["sampleRate"] = asset_info.get("fps")
 
-        extension = os.path.splitext(src_path)[1].lower()
         handlers = {
             ".mov": "Quicktime"
         }
-        handler = handlers.get(extension, None)
+        handler = handlers.get(src_extension, None)
         if handler is not None:
             metadata["handler"] = "<handler><name>%s</name></handler>" % handler
         else:
@@ -254,9 +254,11 @@ class Transcoder(object):
         # transcoding job depend on it, it will be fine by then.
         #
         if dependencies is not None:
-            if os.path.splitext(src_path)[-1].lower() != ".clip":
+            src_extension = os.path.splitext(src_path)[-1].lower()
+            if src_extension != ".clip":
                 path_to_import = self._create_open_clip_file(
                     src_path=src_path,
+                    src_extension=src_extension,
                     asset_info=asset_info
                 )
                 temp_files.append(path_to_import)